@@ -1,21 +1,9 @@
 from statstables import tables, renderers, utils, modeltables
-from statsmodels.base.wrapper import ResultsWrapper
-from statsmodels.regression.linear_model import RegressionResultsWrapper
-from statsmodels.discrete.discrete_model import BinaryResultsWrapper
-from linearmodels.iv.results import IVResults, OLSResults
-from linearmodels.panel.results import (
-    PanelEffectsResults,
-    PanelResults,
-    RandomEffectsResults,
-)
 
 __all__ = ["STParams", "SupportedModels"]
 
 
 class Params(dict):
-    def __init__(self, *args, **kwargs) -> None:
-        self.update(*args, **kwargs)
-
     def _set(self, key, val):
         dict.__setitem__(self, key, val)
 
@@ -23,26 +11,32 @@ class Params(dict):
         return dict.__getitem__(self, key)
 
 
-STParams = Params()
-STParams["ascii_padding"] = 2
-STParams["ascii_header_char"] = "="
-STParams["ascii_footer_char"] = "="
-STParams["ascii_border_char"] = ""
-STParams["ascii_mid_rule_char"] = "-"
-STParams["double_top_rule"] = True
-STParams["double_bottom_rule"] = False
-STParams["max_html_notes_length"] = 80
-STParams["max_ascii_notes_length"] = 80
-STParams["index_alignment"] = "l"
-STParams["column_alignment"] = "c"
+STParams = Params(
+    {
+        "ascii_padding": 2,
+        "ascii_header_char": "=",
+        "ascii_footer_char": "=",
+        "ascii_border_char": "",
+        "ascii_mid_rule_char": "-",
+        "double_top_rule": True,
+        "double_bottom_rule": False,
+        "max_html_notes_length": 80,
+        "max_ascii_notes_length": 80,
+        "index_alignment": "l",
+        "column_alignment": "c",
+    }
+)
 
+# Built in models are keyed by their fully qualified class name so statsmodels
+# and linearmodels aren't imported until a model from them is passed to a table.
+# Custom models can be keyed by either the class or its name.
 SupportedModels = {
-    RegressionResultsWrapper: modeltables.StatsModelsData,
-    ResultsWrapper: modeltables.StatsModelsData,
-    BinaryResultsWrapper: modeltables.StatsModelsData,
-    IVResults: modeltables.LinearModelsData,
-    OLSResults: modeltables.LinearModelsData,
-    PanelEffectsResults: modeltables.LinearModelsData,
-    PanelResults: modeltables.LinearModelsData,
-    RandomEffectsResults: modeltables.LinearModelsData,
+    "statsmodels.regression.linear_model.RegressionResultsWrapper": modeltables.StatsModelsData,
+    "statsmodels.base.wrapper.ResultsWrapper": modeltables.StatsModelsData,
+    "statsmodels.discrete.discrete_model.BinaryResultsWrapper": modeltables.StatsModelsData,
+    "linearmodels.iv.results.IVResults": modeltables.LinearModelsData,
+    "linearmodels.iv.results.OLSResults": modeltables.LinearModelsData,
+    "linearmodels.panel.results.PanelEffectsResults": modeltables.LinearModelsData,
+    "linearmodels.panel.results.PanelResults": modeltables.LinearModelsData,
+    "linearmodels.panel.results.RandomEffectsResults": modeltables.LinearModelsData,
 }
@@ -2,36 +2,51 @@
 import statstables as st
 from .tables import Table
 from abc import ABC, abstractmethod
-from typing import Any, TypeAlias
+from typing import Any, TypeAlias, TYPE_CHECKING, Union
 from dataclasses import dataclass
-from statsmodels.base.wrapper import ResultsWrapper
-from statsmodels.regression.linear_model import RegressionResultsWrapper
-from statsmodels.discrete.discrete_model import BinaryResultsWrapper
-from linearmodels.iv.results import IVResults, OLSResults
-from linearmodels.panel.results import (
-    PanelEffectsResults,
-    PanelResults,
-    RandomEffectsResults,
-)
-
-ModelTypes: TypeAlias = (
-    ResultsWrapper
-    | RegressionResultsWrapper
-    | IVResults
-    | OLSResults
-    | PanelEffectsResults
-    | PanelResults
-    | RandomEffectsResults
-    | BinaryResultsWrapper
-    | Any
-)
+from functools import lru_cache
+from operator import attrgetter
+
+if TYPE_CHECKING:
+    from statsmodels.base.wrapper import ResultsWrapper
+    from statsmodels.regression.linear_model import RegressionResultsWrapper
+    from statsmodels.discrete.discrete_model import BinaryResultsWrapper
+    from linearmodels.iv.results import IVResults, OLSResults
+    from linearmodels.panel.results import (
+        PanelEffectsResults,
+        PanelResults,
+        RandomEffectsResults,
+    )
+
+ModelTypes: TypeAlias = Union[
+    "ResultsWrapper",
+    "RegressionResultsWrapper",
+    "IVResults",
+    "OLSResults",
+    "PanelEffectsResults",
+    "PanelResults",
+    "RandomEffectsResults",
+    "BinaryResultsWrapper",
+    Any,
+]
 
 # model stats that should always be formatted as integers
-INT_VARS = ["observations", "ngroups"]
+INT_VARS = frozenset(("observations", "ngroups"))
+# sentinel for attributes a model doesn't have
+_MISSING = object()
+
+
+@lru_cache(maxsize=None)
+def _float_spec(sig_digits: int) -> str:
+    """
+    Format spec used for non-integer model stats
+    """
+    return f".{sig_digits}f"
 
 
 @dataclass
 class ModelData(ABC):
+    __slots__ = ("model", "data", "summary_parameters")
     model: ModelTypes
 
     def __post_init__(self):
@@ -49,12 +64,15 @@ class ModelData(ABC):
         """
         Get a formatted value for the table
         """
-        value = getattr(self, stat)
+        try:
+            value = self.data[stat]
+        except KeyError:
+            raise AttributeError(f"ModelData object has no attribute {stat}")
         if stat in INT_VARS:
-            return f"{int(value)}"
+            return str(int(value))
         if isinstance(value, str):
-            return f"{value}"
-        return f"{value:.{sig_digits}f}"
+            return value
+        return format(value, _float_spec(sig_digits))
 
     def __getitem__(self, name: str) -> Any:
         return self.data[name]
@@ -79,10 +97,18 @@ STATSMODELS_MAP = {
     "dof_resid": "df_resid",
     "pseudo_r2": "prsquared",
 }
+# attributes every statsmodels results object has are pulled with a single
+# attrgetter call, the rest depend on the type of model
+_SM_COMMON = ("params", "sterrs", "pvalues", "observations", "dof_model", "dof_resid")
+_SM_COMMON_GETTER = attrgetter(*(STATSMODELS_MAP[info] for info in _SM_COMMON))
+_SM_OPTIONAL = {
+    info: attr for info, attr in STATSMODELS_MAP.items() if info not in _SM_COMMON
+}
 
 
 @dataclass
 class StatsModelsData(ModelData):
+    __slots__ = ()
 
     def __post_init__(self):
         super().__post_init__()
@@ -101,14 +127,20 @@ class StatsModelsData(ModelData):
         # make a dictionary with the parameter values so they can be looked up
         # by covariate order. If cov. order not provided, use the order of the first
         # model, then add on as needed for subsequent models
-        for info, attr in STATSMODELS_MAP.items():
-            try:
-                self.data[info] = getattr(self.model, attr)
-            except AttributeError:
-                pass
-        self.data["param_labels"] = set(self.model.params.index.values)
-        self.data["cis_low"] = self.model.conf_int()[0]
-        self.data["cis_high"] = self.model.conf_int()[1]
+        try:
+            self.data.update(zip(_SM_COMMON, _SM_COMMON_GETTER(self.model)))
+            remaining = _SM_OPTIONAL
+        except AttributeError:
+            remaining = STATSMODELS_MAP
+        self.data.update(
+            (info, val)
+            for info, attr in remaining.items()
+            if (val := getattr(self.model, attr, _MISSING)) is not _MISSING
+        )
+        self.data["param_labels"] = self.model.params.index
+        cis = self.model.conf_int()
+        self.data["cis_low"] = cis[0]
+        self.data["cis_high"] = cis[1]
         self.data["dependent_variable"] = self.model.model.endog_names
         self.data["model_type"] = self.model.model.__class__.__name__
 
@@ -128,6 +160,7 @@ LINEAR_MODELS_MAP = {
 
 @dataclass
 class LinearModelsData(ModelData):
+    __slots__ = ()
 
     def __post_init__(self):
         super().__post_init__()
@@ -146,17 +179,25 @@ class LinearModelsData(ModelData):
         # make a dictionary with the parameter values so they can be looked up
         # by covariate order. If cov. order not provided, use the order of the first
         # model, then add on as needed for subsequent models
-        for info, attr in LINEAR_MODELS_MAP.items():
-            try:
-                self.data[info] = getattr(self.model, attr)
-            except AttributeError:
-                pass
-        self.data["param_labels"] = set(self.model.params.index.values)
-        self.data["cis_low"] = self.model.conf_int()["lower"]
-        self.data["cis_high"] = self.model.conf_int()["upper"]
+        self.data.update(
+            (info, val)
+            for info, attr in LINEAR_MODELS_MAP.items()
+            if (val := getattr(self.model, attr, _MISSING)) is not _MISSING
+        )
+        self.data["param_labels"] = self.model.params.index
+        cis = self.model.conf_int()
+        self.data["cis_low"] = cis["lower"]
+        self.data["cis_high"] = cis["upper"]
         self.data["dependent_variable"] = self.model.summary.tables[0].data[0][1]
         self.data["fstat"] = self.model.f_statistic.stat
         self.data["fstat_pvalue"] = self.model.f_statistic.pval
+        # linearmodels is already loaded if we have one of its models
+        from linearmodels.panel.results import (
+            PanelEffectsResults,
+            PanelResults,
+            RandomEffectsResults,
+        )
+
         if isinstance(
             self.model, (PanelEffectsResults, RandomEffectsResults, PanelResults)
         ):
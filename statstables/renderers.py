@@ -1,43 +1,39 @@
+import numpy as np
 import statstables as st
 import textwrap
-from abc import ABC, abstractmethod
-
-
-class Renderer(ABC):
-    def __init__(self):
-        pass
-
-    @abstractmethod
-    def render(self) -> str:
-        pass
-
-    @abstractmethod
-    def generate_header(self) -> str: ...
-
-    @abstractmethod
-    def generate_body(self) -> str: ...
-
-    @abstractmethod
-    def generate_footer(self) -> str: ...
-
-    @abstractmethod
-    def _create_line(self, line) -> str: ...
+from functools import lru_cache
+
+# LaTeX escape characters, borrowed from pandas.io.formats.latex and Stargazer
+_LATEX_ESCAPE_CHARS = (
+    ("\\", r"\textbackslash "),
+    ("_", r"\_"),
+    ("%", r"\%"),
+    ("$", r"\$"),
+    ("#", r"\#"),
+    ("{", r"\{"),
+    ("}", r"\}"),
+    ("~", r"\textasciitilde "),
+    ("^", r"\textasciicircum "),
+    ("&", r"\&"),
+)
+_LATEX_ESCAPE_TABLE = str.maketrans(dict(_LATEX_ESCAPE_CHARS))
+_LATEX_SPECIAL_CHARS = frozenset(char for char, _ in _LATEX_ESCAPE_CHARS)
+
+
+@lru_cache(maxsize=4096)
+def _latex_escape(text: str) -> str:
+    # labels and values repeat within and across tables, so share one cache
+    return text.translate(_LATEX_ESCAPE_TABLE)
+
+
+class Renderer:
+    # plain base class rather than an ABC since renderers are internal and
+    # created once per render call. Each renderer provides render,
+    # generate_header, generate_body, generate_footer and _create_line.
+    pass
 
 
 class LatexRenderer(Renderer):
-    # LaTeX escape characters, borrowed from pandas.io.formats.latex and Stargazer
-    _ESCAPE_CHARS = [
-        ("\\", r"\textbackslash "),
-        ("_", r"\_"),
-        ("%", r"\%"),
-        ("$", r"\$"),
-        ("#", r"\#"),
-        ("{", r"\{"),
-        ("}", r"\}"),
-        ("~", r"\textasciitilde "),
-        ("^", r"\textasciicircum "),
-        ("&", r"\&"),
-    ]
     ALIGNMENTS = {
         "l": "l",
         "c": "c",
@@ -51,6 +47,8 @@ class LatexRenderer(Renderer):
         self.table = table
         self.ialign = self.ALIGNMENTS[self.table.index_alignment]
         self.calign = self.ALIGNMENTS[self.table.column_alignment]
+        self.notes = table._render_notes("latex")
+        self.custom_lines = table._render_lines("latex")
 
     def render(self, only_tabular=False):
         out = self.generate_header(only_tabular)
@@ -60,106 +58,118 @@ class LatexRenderer(Renderer):
         return out
 
     def generate_header(self, only_tabular=False):
-        header = ""
+        header = []
         if not only_tabular:
-            header += "\\begin{table}[!htbp]\n  \\centering\n"
+            header.append("\\begin{table}[!htbp]\n  \\centering\n")
 
             if self.table.caption_location == "top":
                 if self.table.caption is not None:
-                    header += "  \\caption{" + self.table.caption + "}\n"
+                    header.append("  \\caption{" + self.table.caption + "}\n")
 
                 if self.table.label is not None:
-                    header += "  \\label{" + self.table.label + "}\n"
+                    header.append("  \\label{" + self.table.label + "}\n")
 
         content_columns = self.calign * self.table.ncolumns
         if self.table.include_index:
             content_columns = self.ialign + content_columns
-        header += "\\begin{tabular}{" + content_columns + "}\n"
-        header += "  \\toprule\n"
+        header.append("\\begin{tabular}{" + content_columns + "}\n")
+        index_prefix = ""
+        if self.table.include_index:
+            index_prefix = "  " + self.table.index_name + " & "
+        custom_tex_lines = self.table.custom_tex_lines
+        custom_lines = self.custom_lines
+        header.append("  \\toprule\n")
         if st.STParams["double_top_rule"]:
-            header += "  \\toprule\n"
+            header.append("  \\toprule\n")
         for col, spans, underline in self.table._multicolumns:
-            header += ("  " + self.table.index_name + " & ") * self.table.include_index
+            header.append(index_prefix)
             # TODO: Implement underline
-            header += " & ".join(
-                [
-                    f"\\multicolumn{{{s}}}{{c}}{{{self._escape(c)}}}"
-                    for c, s in zip(col, spans)
-                ]
+            header.append(
+                " & ".join(
+                    [
+                        f"\\multicolumn{{{s}}}{{c}}{{{self._escape(c)}}}"
+                        for c, s in zip(col, spans)
+                    ]
+                )
             )
-            header += " \\\\\n"
-        if self.table.custom_tex_lines["after-multicolumns"]:
-            for line in self.table.custom_tex_lines["after-multicolumns"]:
-                header += "  " + line + "\n"
+            header.append(" \\\\\n")
+        for line in custom_tex_lines["after-multicolumns"]:
+            header.append("  " + line + "\n")
         if self.table.show_columns:
-            header += ("  " + self.table.index_name + " & ") * self.table.include_index
-            header += " & ".join(
-                [
-                    self._escape(self.table._column_labels.get(col, col))
-                    for col in self.table.columns
-                ]
+            header.append(index_prefix)
+            header.append(
+                " & ".join(
+                    [
+                        self._escape(self.table._column_labels.get(col, col))
+                        for col in self.table.columns
+                    ]
+                )
             )
-            header += "\\\\\n"
-        if self.table.custom_tex_lines["after-columns"]:
-            for line in self.table.custom_tex_lines["after-columns"]:
-                header += "  " + line + "\n"
-        if self.table.custom_lines["after-columns"]:
-            for line in self.table.custom_lines["after-columns"]:
-                header += self._create_line(line)
-        header += "  \\midrule\n"
+            header.append("\\\\\n")
+        for line in custom_tex_lines["after-columns"]:
+            header.append("  " + line + "\n")
+        for line in custom_lines["after-columns"]:
+            header.append(self._create_line(line))
+        header.append("  \\midrule\n")
 
-        return header
+        return "".join(header)
 
     def generate_body(self):
-        rows = self.table._create_rows()
-        row_str = ""
+        table = self.table
+        escape = self._escape
+        rows = table._create_rows()
+        row_str = []
         for row in rows:
-            row_str += "  " + " & ".join([self._escape(r) for r in row]) + " \\\\\n"
-        for line in self.table.custom_tex_lines["after-body"]:
-            row_str += line
-        for line in self.table.custom_lines["after-body"]:
-            row_str += self._create_line(line)
-        if isinstance(self.table, st.tables.ModelTable):
-            row_str += "  \\midrule\n"
-            stats_rows = self.table._create_stats_rows(renderer="latex")
+            row_str.append("  " + " & ".join(map(escape, row)) + " \\\\\n")
+        for line in table.custom_tex_lines["after-body"]:
+            row_str.append(line)
+        for line in self.custom_lines["after-body"]:
+            row_str.append(self._create_line(line))
+        if isinstance(table, st.tables.ModelTable):
+            row_str.append("  \\midrule\n")
+            stats_rows = table._create_stats_rows(renderer="latex")
             for row in stats_rows:
-                row_str += "  " + " & ".join(row) + " \\\\\n"
-        return row_str
+                row_str.append("  " + " & ".join(row) + " \\\\\n")
+        return "".join(row_str)
 
     def generate_footer(self, only_tabular=False):
-        footer = "  \\bottomrule\n"
-        if self.table.custom_lines["after-footer"]:
-            for line in self.table.custom_lines["after-footer"]:
-                footer += self._create_line(line)
-            footer += "  \\bottomrule\n"
+        footer = ["  \\bottomrule\n"]
+        after_footer = self.custom_lines["after-footer"]
+        if after_footer:
+            for line in after_footer:
+                footer.append(self._create_line(line))
+            footer.append("  \\bottomrule\n")
             if st.STParams["double_bottom_rule"]:
-                footer += "  \\bottomrule\n"
-        if self.table.notes:
-            for note, alignment, escape in self.table.notes:
+                footer.append("  \\bottomrule\n")
+        if self.notes:
+            for note, alignment, escape in self.notes:
                 align_cols = self.table.ncolumns + self.table.include_index
-                footer += f"  \\multicolumn{{{align_cols}}}{{{alignment}}}"
+                footer.append(f"  \\multicolumn{{{align_cols}}}{{{alignment}}}")
                 _note = self._escape(note) if escape else note
-                footer += "{{" + "\\small \\textit{" + _note + "}}}\\\\\n"
+                footer.append("{{" + "\\small \\textit{" + _note + "}}}\\\\\n")
 
-        footer += "\\end{tabular}\n"
+        footer.append("\\end{tabular}\n")
         if not only_tabular:
             if self.table.caption_location == "bottom":
                 if self.table.caption is not None:
-                    footer += "  \\caption{" + self.table.caption + "}\n"
+                    footer.append("  \\caption{" + self.table.caption + "}\n")
 
                 if self.table.label is not None:
-                    footer += "  \\label{" + self.table.label + "}\n"
-            footer += "\\end{table}\n"
+                    footer.append("  \\label{" + self.table.label + "}\n")
+            footer.append("\\end{table}\n")
 
-        return footer
+        return "".join(footer)
 
     def _escape(self, text: str) -> str:
-        for char, escaped in self._ESCAPE_CHARS:
-            text = text.replace(char, escaped)
-        return text
+        # most cells are numbers that don't need escaping
+        if _LATEX_SPECIAL_CHARS.isdisjoint(text):
+            return text
+        return _latex_escape(text)
 
     def _create_line(self, line: dict) -> str:
-        out = ("  " + line["label"] + " & ") * self.table.include_index
+        out = ""
+        if self.table.include_index:
+            out = "  " + line["label"] + " & "
         out += " & ".join(line["line"])
         out += "\\\\\n"
 
@@ -178,9 +188,13 @@ class HTMLRenderer(Renderer):
 
     def __init__(self, table):
         self.table = table
+        self.notes = table._render_notes("html")
+        self.custom_lines = table._render_lines("html")
         self.ncolumns = self.table.ncolumns + int(self.table.include_index)
         self.ialign = self.ALIGNMENTS[self.table.index_alignment]
         self.calign = self.ALIGNMENTS[self.table.column_alignment]
+        self._index_td = f'      <td style="text-align:{self.ialign};">'
+        self._td = f'      <td style="text-align:{self.calign};">'
 
     def render(self):
         out = self.generate_header()
@@ -189,101 +203,123 @@ class HTMLRenderer(Renderer):
         return out
 
     def generate_header(self):
-        header = "<table>\n"
-        header += "  <thead>\n"
+        header = ["<table>\n"]
+        header.append("  <thead>\n")
+        index_th = ""
+        if self.table.include_index:
+            index_th = f'      <th style="text-align:{self.ialign};">{self.table.index_name}</th>\n'
         for col, spans, underline in self.table._multicolumns:
-            header += "    <tr>\n"
-            header += (
-                f'      <th style="text-align:{self.ialign};">{self.table.index_name}</th>\n'
-            ) * self.table.include_index
+            header.append("    <tr>\n")
+            header.append(index_th)
             th = '<th colspan="{s}" style="text-align:{a};">{c}</th>'
             if underline:
                 th = '<th colspan="{s}" style="text-align:{a};"><u>{c}</u></th>'
-            header += "      " + " ".join(
-                [
-                    # f'<th colspan="{s}" style="text-align:center;">{c}</th>'
-                    th.format(c=c, s=s, a=self.calign)
-                    for c, s in zip(col, spans)
-                ]
+            header.append(
+                "      "
+                + " ".join(
+                    [
+                        # f'<th colspan="{s}" style="text-align:center;">{c}</th>'
+                        th.format(c=c, s=s, a=self.calign)
+                        for c, s in zip(col, spans)
+                    ]
+                )
             )
-            header += "\n"
-            header += "    </tr>\n"
+            header.append("\n")
+            header.append("    </tr>\n")
         for line in self.table.custom_html_lines["after-multicolumns"]:
             # TODO: Implement
             pass
         if self.table.show_columns:
-            header += "    <tr>\n"
-            header += (
-                f"      <th>{self.table.index_name}</th>\n"
-            ) * self.table.include_index
-            for col in self.table.columns:
-                header += f'      <th style="text-align:{self.calign};">{self.table._column_labels.get(col, col)}</th>\n'
-            header += "    </tr>\n"
-        if self.table.custom_lines["after-columns"]:
-            for line in self.table.custom_lines["after-columns"]:
-                header += self._create_line(line)
-        header += "  </thead>\n"
-        header += "  <tbody>\n"
-        return header
+            header.append("    <tr>\n")
+            if self.table.include_index:
+                header.append(f"      <th>{self.table.index_name}</th>\n")
+            header.append(
+                self._join_cells(
+                    f'      <th style="text-align:{self.calign};">',
+                    [
+                        self.table._column_labels.get(col, col)
+                        for col in self.table.columns
+                    ],
+                    "</th>\n",
+                )
+            )
+            header.append("    </tr>\n")
+        for line in self.custom_lines["after-columns"]:
+            header.append(self._create_line(line))
+        header.append("  </thead>\n")
+        header.append("  <tbody>\n")
+        return "".join(header)
 
     def generate_body(self):
-        rows = self.table._create_rows()
-        row_str = ""
+        table = self.table
+        rows = table._create_rows()
+        row_str = []
         for row in rows:
-            row_str += "    <tr>\n"
-            for i, r in enumerate(row):
-                alignment = self.calign
-                if i == 0 and self.table.include_index:
-                    alignment = self.ialign
-                row_str += f'      <td style="text-align:{alignment};">{r}</td>\n'
-            row_str += "    </tr>\n"
-        for line in self.table.custom_html_lines["after-body"]:
-            row_str += line
-        for line in self.table.custom_lines["after-body"]:
-            row_str += self._create_line(line)
-        if isinstance(self.table, st.tables.ModelTable):
-            stats_rows = self.table._create_stats_rows(renderer="html")
+            row_str.append(self._create_row(row))
+        for line in table.custom_html_lines["after-body"]:
+            row_str.append(line)
+        for line in self.custom_lines["after-body"]:
+            row_str.append(self._create_line(line))
+        if isinstance(table, st.tables.ModelTable):
+            stats_rows = table._create_stats_rows(renderer="html")
             # insert a horizontal rule before the stats rows
-            row_str += "    <tr>\n"
-            row_str += (
+            row_str.append("    <tr>\n")
+            row_str.append(
                 "      <td colspan='100%' style='border-top: 1px solid black;'></td>\n"
             )
-            row_str += "    </tr>\n"
+            row_str.append("    </tr>\n")
             for row in stats_rows:
-                row_str += "    <tr>\n"
-                for i, r in enumerate(row):
-                    alignment = self.calign
-                    if i == 0 and self.table.include_index:
-                        alignment = self.ialign
-                    row_str += f'      <td style="text-align:{alignment};">{r}</td>\n'
-                row_str += "    </tr>\n"
-        return row_str
+                row_str.append(self._create_row(row))
+        return "".join(row_str)
 
     def generate_footer(self):
-        footer = ""
-        if self.table.custom_lines["after-footer"]:
-            footer += "    <tr>\n"
-            for line in self.table.custom_lines["after-footer"]:
-                footer += self._create_line(line)
-            footer += "    </tr>\n"
-        if self.table.notes:
+        footer = []
+        after_footer = self.custom_lines["after-footer"]
+        if after_footer:
+            footer.append("    <tr>\n")
+            for line in after_footer:
+                footer.append(self._create_line(line))
+            footer.append("    </tr>\n")
+        if self.notes:
             ncols = self.table.ncolumns + self.table.include_index
-            for note, alignment, _ in self.table.notes:
+            for note, alignment, _ in self.notes:
                 _notes = textwrap.wrap(note, width=st.STParams["max_html_notes_length"])
                 for _note in _notes:
-                    footer += (
+                    footer.append(
                         f'    <tr><td colspan="{ncols}" '
                         f'style="text-align:{self.ALIGNMENTS[alignment]};'
                         f'"><i>{_note}</i></td></tr>\n'
                     )
-        footer += "  </tbody>\n"
-        return footer
+        footer.append("  </tbody>\n")
+        return "".join(footer)
+
+    @staticmethod
+    def _join_cells(cell_open: str, cells: list, cell_close: str) -> str:
+        """
+        Wrap every cell in the opening and closing tags with a single join
+        """
+        if len(cells) == 0:
+            return ""
+        sep = cell_close + cell_open
+        return cell_open + sep.join(map(str, cells)) + cell_close
+
+    def _create_row(self, row: list) -> str:
+        cells = row
+        index_cell = ""
+        if self.table.include_index:
+            index_cell = self._index_td + f"{row[0]}</td>\n"
+            cells = row[1:]
+        return (
+            "    <tr>\n"
+            + index_cell
+            + self._join_cells(self._td, cells, "</td>\n")
+            + "    </tr>\n"
+        )
 
     def _create_line(self, line):
         out = "    <tr>\n"
-        out += (
-            f'      <th style="text-align:{self.ialign};"' + f">{line['label']}</th>\n"
-        ) * self.table.include_index
+        if self.table.include_index:
+            out += f'      <th style="text-align:{self.ialign};">{line["label"]}</th>\n'
         for l in line["line"]:
             out += f'      <td style="text-align:{self.calign};">{l}</td>\n'
         out += "    </tr>\n"
@@ -303,8 +339,15 @@ class ASCIIRenderer(Renderer):
 
     def __init__(self, table):
         self.table = table
+        self.notes = table._render_notes("ascii")
+        self.custom_lines = table._render_lines("ascii")
         # number of spaces to place on either side of cell values
         self.padding = st.STParams["ascii_padding"]
+        # characters used to draw the table, read once rather than for every row
+        self._border = st.STParams["ascii_border_char"]
+        self._header_char = st.STParams["ascii_header_char"]
+        self._mid_rule_char = st.STParams["ascii_mid_rule_char"]
+        self._footer_char = st.STParams["ascii_footer_char"]
         self.ncolumns = self.table.ncolumns + int(self.table.include_index)
         self.ialign = self.ALIGNMENTS[self.table.index_alignment]
         self.calign = self.ALIGNMENTS[self.table.column_alignment]
@@ -315,6 +358,7 @@ class ASCIIRenderer(Renderer):
         self.max_body_cell_size = 0
         self.max_index_name_cell_size = 0
         self._len = 0
+        self._row_formats = {}
 
     @property
     def padding(self) -> int:
@@ -337,118 +381,99 @@ class ASCIIRenderer(Renderer):
         return out
 
     def generate_header(self) -> str:
-        header = (
-            st.STParams["ascii_header_char"] * (self._len + (2 * self._border_len))
-            + "\n"
-        )
+        header = [self._top_rule]
         if st.STParams["double_top_rule"]:
-            header = (
-                st.STParams["ascii_header_char"] * (self._len + (2 * self._border_len))
-                + "\n"
-            )
-        # underlines = st.STParams["ascii_border_char"]
+            header = [self._top_rule]
+        index_space = ""
+        if self.table.include_index:
+            index_space = " " * self.max_index_name_cell_size
         for col, span, underline in self.table._multicolumns:
-            header += st.STParams["ascii_border_char"] + (
-                " " * self.max_index_name_cell_size * self.table.include_index
-            )
-            # underlines += " " * self.max_index_name_cell_size * self.table.include_index
-            underlines = (
-                st.STParams["ascii_border_char"]
-                + " " * self.max_index_name_cell_size * self.table.include_index
-            )
+            header.append(self._border + index_space)
+            underlines = self._border + index_space
 
             for c, s in zip(col, span):
                 _size = self.max_body_cell_size * s
-                header += f"{c:^{_size}}"
+                header.append(f"{c:^{_size}}")
                 underlines += f"{'-' * (_size - 2):^{_size}}"
-            header += f"{st.STParams['ascii_border_char']}\n"
+            header.append(self._border + "\n")
             if underline:
-                header += underlines + f"{st.STParams['ascii_border_char']}\n"
+                header.append(underlines + self._border + "\n")
         if self.table.show_columns:
-            header += st.STParams["ascii_border_char"]
-            header += (
-                f"{self.table.index_name:^{self.max_index_name_cell_size}}"
-            ) * self.table.include_index
+            header.append(self._border)
+            if self.table.include_index:
+                header.append(
+                    f"{self.table.index_name:^{self.max_index_name_cell_size}}"
+                )
             for col in self.table.columns:
-                header += f"{self.table._column_labels.get(col, col):^{self.max_body_cell_size}}"
-            header += f"{st.STParams['ascii_border_char']}\n"
-            header += (
-                st.STParams["ascii_border_char"]
-                + st.STParams["ascii_mid_rule_char"] * (self._len)
-                + f"{st.STParams['ascii_border_char']}\n"
-            )
-        return header
+                header.append(
+                    f"{self.table._column_labels.get(col, col):^{self.max_body_cell_size}}"
+                )
+            header.append(self._border + "\n")
+            header.append(self._mid_rule)
+        return "".join(header)
 
     # get the length of the header lines by counting number of characters in each column
     def generate_body(self) -> str:
-        rows = self.table._create_rows()
-        body = ""
-        for row in rows:
-            body += st.STParams["ascii_border_char"]
-            for i, r in enumerate(row):
-                _size = self.max_body_cell_size
-                _align = self.calign
-                if i == 0 and self.table.include_index:
-                    _size = self.max_index_name_cell_size - self.padding
-                    _align = self.ialign
-                    body += " " * self.padding + f"{r:{_align}{_size}}"
-                else:
-                    body += f"{r:{_align}{_size}}"
-            body += f"{st.STParams['ascii_border_char']}\n"
-
-        if self.table.custom_lines["after-body"]:
-            for line in self.table.custom_lines["after-body"]:
-                body += self._create_line(line)
-
-        if isinstance(self.table, st.tables.ModelTable):
-            stats_rows = self.table._create_stats_rows(renderer="ascii")
-            body += (
-                st.STParams["ascii_mid_rule_char"]
-                * (self._len + (2 * self._border_len))
-                + "\n"
-            )
-            for row in stats_rows:
-                body += f"{st.STParams['ascii_border_char']}"
-                for i, r in enumerate(row):
-                    _size = self.max_body_cell_size
-                    if i == 0 and self.table.include_index:
-                        _size = self.max_index_name_cell_size - self.padding
-                        body += " " * self.padding + f"{r:{self.ialign}{_size}}"
-                    else:
-                        body += f"{r:{self.calign}{_size}}"
-                body += f"{st.STParams['ascii_border_char']}\n"
-        return body
+        table = self.table
+        body = [self._format_row(row) for row in self._rows]
+
+        for line in self.custom_lines["after-body"]:
+            body.append(self._create_line(line))
+
+        if isinstance(table, st.tables.ModelTable):
+            body.append(self._stats_rule)
+            body.extend(self._format_row(row) for row in self._stats_rows)
+        return "".join(body)
+
+    def _format_row(self, row) -> str:
+        # rows don't always match ncolumns (e.g. MeanDifferenceTable rows keep
+        # their label without an index), so key the format on the row length
+        ncells = len(row)
+        row_format = self._row_formats.get(ncells)
+        if row_format is None:
+            row_format = self._row_format(ncells)
+            self._row_formats[ncells] = row_format
+        return row_format.format(*row)
+
+    def _row_format(self, ncells: int) -> str:
+        """
+        Build a format string that lays out an entire row of the table body with
+        `ncells` cells, so each row is formatted with one call rather than one
+        per cell.
+        """
+        border = self._border.replace("{", "{{").replace("}", "}}")
+        nbody = ncells - int(self.table.include_index)
+        cells = f"{{:{self.calign}{self.max_body_cell_size}}}" * nbody
+        if self.table.include_index and ncells:
+            index_size = self.max_index_name_cell_size - self.padding
+            cells = " " * self.padding + f"{{:{self.ialign}{index_size}}}" + cells
+        return border + cells + border + "\n"
 
     def generate_footer(self) -> str:
-        footer = st.STParams["ascii_footer_char"] * (self._len + (2 * self._border_len))
+        footer = [self._bottom_rule]
         if st.STParams["double_bottom_rule"]:
-            footer += st.STParams["ascii_footer_char"] * (
-                self._len + (2 * self._border_len)
-            )
-        if self.table.custom_lines["after-footer"]:
-            footer += "\n"
-            for line in self.table.custom_lines["after-footer"]:
-                footer += self._create_line(line)
-            footer += st.STParams["ascii_footer_char"] * (
-                self._len + (2 * self._border_len)
-            )
+            footer.append(self._bottom_rule)
+        after_footer = self.custom_lines["after-footer"]
+        if after_footer:
+            footer.append("\n")
+            for line in after_footer:
+                footer.append(self._create_line(line))
+            footer.append(self._bottom_rule)
             if st.STParams["double_bottom_rule"]:
-                footer += st.STParams["ascii_footer_char"] * (
-                    self._len + (2 * self._border_len)
-                )
-        if self.table.notes:
-            footer += "\n"
-            for note, alignment, _ in self.table.notes:
+                footer.append(self._bottom_rule)
+        if self.notes:
+            footer.append("\n")
+            for note, alignment, _ in self.notes:
                 notes = textwrap.wrap(
                     note, width=min(self._len, st.STParams["max_ascii_notes_length"])
                 )
                 _alignment = self.ALIGNMENTS[alignment]
                 for _note in notes:
-                    footer += f"\n{_note:{_alignment}{self._len}}"
-        return footer
+                    footer.append(f"\n{_note:{_alignment}{self._len}}")
+        return "".join(footer)
 
     def _create_line(self, line) -> str:
-        _line = st.STParams["ascii_border_char"]
+        _line = self._border
         if self.table.include_index:
             _line += (
                 " " * self.padding
@@ -456,37 +481,33 @@ class ASCIIRenderer(Renderer):
             )
         for l in line["line"]:
             _line += f"{l:{self.calign}{self.max_body_cell_size}}"
-        _line += st.STParams["ascii_border_char"] + "\n"
+        _line += self._border + "\n"
         return _line
 
+    def _measure_rows(self, rows: list[list[str]]) -> None:
+        """
+        Update the largest cell and row sizes to fit all of the given rows
+        """
+        sizes = np.array([[len(str(cell)) for cell in row] for row in rows])
+        if sizes.size == 0:
+            return
+        sizes += self.padding * 2
+        self.max_body_cell_size = max(self.max_body_cell_size, int(sizes.max()))
+        self.max_row_len = max(self.max_row_len, int(sizes.sum(axis=1).max()))
+        if self.table.include_index:
+            self.max_index_name_cell_size = max(
+                self.max_index_name_cell_size, int(sizes[:, 0].max())
+            )
+
     def _get_table_widths(self) -> None:
         self.reset_size_parameters()
-        # find longest row and biggest cell
-        rows = self.table._create_rows()
-        for row in rows:
-            row_len = 0
-            for i, cell in enumerate(row):
-                cell_size = len(str(cell)) + (self.padding * 2)
-                self.max_body_cell_size = max(self.max_body_cell_size, cell_size)
-                row_len += cell_size
-                if i == 0 and self.table.include_index:
-                    self.max_index_name_cell_size = max(
-                        self.max_index_name_cell_size, cell_size
-                    )
-            self.max_row_len = max(self.max_row_len, row_len)
+        # find longest row and biggest cell. The rows are kept so generate_body
+        # doesn't have to create them again
+        self._rows = self.table._create_rows()
+        self._measure_rows(self._rows)
         if isinstance(self.table, st.tables.ModelTable):
-            stats_rows = self.table._create_stats_rows(renderer="ascii")
-            for row in stats_rows:
-                row_len = 0
-                for i, cell in enumerate(row):
-                    cell_size = len(str(cell)) + (self.padding * 2)
-                    self.max_body_cell_size = max(self.max_body_cell_size, cell_size)
-                    row_len += cell_size
-                    if i == 0 and self.table.include_index:
-                        self.max_index_name_cell_size = max(
-                            self.max_index_name_cell_size, cell_size
-                        )
-                self.max_row_len = max(self.max_row_len, row_len)
+            self._stats_rows = self.table._create_stats_rows(renderer="ascii")
+            self._measure_rows(self._stats_rows)
 
         if self.table.include_index:
             index_name_size = len(str(self.table.index_name)) + (self.padding * 2)
@@ -506,4 +527,11 @@ class ASCIIRenderer(Renderer):
             self.max_row_len = max(self.max_row_len, col_len)
         self._len = self.max_body_cell_size * self.table.ncolumns
         self._len += self.max_index_name_cell_size
-        self._border_len = len(st.STParams["ascii_border_char"])
+        self._border_len = len(self._border)
+        # the horizontal rules only depend on the table width, so build them once
+        full_len = self._len + (2 * self._border_len)
+        self._top_rule = self._header_char * full_len + "\n"
+        self._mid_rule = self._border + self._mid_rule_char * self._len + self._border
+        self._mid_rule += "\n"
+        self._stats_rule = self._mid_rule_char * full_len + "\n"
+        self._bottom_rule = self._footer_char * full_len
@@ -5,9 +5,68 @@ from abc import ABC, abstractmethod
 from scipy import stats
 from typing import Union, Callable
 from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
 from .renderers import LatexRenderer, HTMLRenderer, ASCIIRenderer
-from .utils import pstars, validate_line_location
+from .utils import pstars, pstars_array, validate_line_location
+
+# valid options for table parameters
+CAPTION_LOCATIONS = frozenset(("top", "bottom"))
+NOTE_ALIGNMENTS = frozenset(("l", "c", "r"))
+# whether the default formatter treats a value as a number, keyed by the exact
+# type of the most common cell values. Other types fall back to isinstance
+_NUMBER_TYPES = {float: True, np.float64: True, int: True, bool: True, str: False}
+
+
+def _format_number(value: Union[int, float], spec: str) -> str:
+    # -0.0 == 0.0 so they would share a cache entry, but they format differently
+    if value == 0:
+        return format(value, spec)
+    return _cached_format_number(value, spec)
+
+
+@lru_cache(maxsize=None)
+def _spec_formatter(spec: str) -> Callable:
+    """
+    Turn a format spec like ",.2f" into a formatter. The bound str.format
+    method skips the extra Python call a lambda wrapping an f-string adds.
+    """
+    return ("{:" + spec + "}").format
+
+
+def _is_format_spec(spec: str) -> bool:
+    """
+    Check that a format spec can be applied to a float or an integer, so typos
+    are caught when formatters are set rather than when the table is rendered.
+    """
+    for value in (0.0, 0):
+        try:
+            format(value, spec)
+            return True
+        except ValueError:
+            pass
+    return False
+
+
+@lru_cache(maxsize=32)
+def _stars_note(p_values: tuple, less_than: str) -> str:
+    """
+    Text explaining the significance stars, e.g. "*p<0.1, **p<0.05, ***p<0.01".
+    The p-values rarely change between renders, so the note is cached.
+    """
+    return ", ".join(
+        [
+            f"{'*' * i}{less_than}{p}"
+            for i, p in enumerate(sorted(p_values, reverse=True), start=1)
+        ]
+    )
+
+
+@lru_cache(maxsize=4096)
+def _cached_format_number(value: Union[int, float], spec: str) -> str:
+    # tables often repeat values (counts, group sizes) and are re-rendered for
+    # each output format, so cache the formatted strings
+    return format(value, spec)
 
 
 class Table(ABC):
@@ -16,6 +75,7 @@ class Table(ABC):
     """
 
     VALID_ALIGNMENTS = ["l", "r", "c", "left", "right", "center"]
+    _ALIGNMENTS = frozenset(VALID_ALIGNMENTS)
 
     def __init__(self):
         self.reset_params()
@@ -61,10 +121,9 @@ class Table(ABC):
 
     @caption_location.setter
     def caption_location(self, location: str) -> None:
-        assert location in [
-            "top",
-            "bottom",
-        ], "caption_location must be 'top' or 'bottom'"
+        assert (
+            location in CAPTION_LOCATIONS
+        ), "caption_location must be 'top' or 'bottom'"
         self._caption_location = location
 
     @property
@@ -103,6 +162,7 @@ class Table(ABC):
     def sig_digits(self, digits: int) -> None:
         assert isinstance(digits, int), "sig_digits must be an integer"
         self._sig_digits = digits
+        self._number_spec = None
 
     @property
     def thousands_sep(self) -> str:
@@ -115,6 +175,7 @@ class Table(ABC):
     def thousands_sep(self, sep: str) -> None:
         assert isinstance(sep, str), "thousands_sep must be a string"
         self._thousands_sep = sep
+        self._number_spec = None
 
     @property
     def include_index(self) -> bool:
@@ -162,7 +223,7 @@ class Table(ABC):
     @index_alignment.setter
     def index_alignment(self, alignment: str) -> None:
         assert (
-            alignment in self.VALID_ALIGNMENTS
+            alignment in self._ALIGNMENTS
         ), f"index_alignment must be in {self.VALID_ALIGNMENTS}"
         self._index_alignment = alignment
 
@@ -176,7 +237,7 @@ class Table(ABC):
     @column_alignment.setter
     def column_alignment(self, alignment: str) -> None:
         assert (
-            alignment in self.VALID_ALIGNMENTS
+            alignment in self._ALIGNMENTS
         ), f"column_alignment must be in {self.VALID_ALIGNMENTS}"
         self._column_alignment = alignment
 
@@ -274,7 +335,8 @@ class Table(ABC):
     def custom_formatters(self, formatters: dict) -> None:
         """
         Method to set custom formatters either along the columns or index. Each
-        key in the formatters dict must be a function that returns a string.
+        value in the formatters dict must be a function that returns a string or
+        a format spec string, like ",.2f", that will be applied to the values.
 
         You cannot set both column and index formatters at this time. Whichever
         is set last will be the one used.
@@ -282,9 +344,10 @@ class Table(ABC):
         Parameters
         ----------
         formatters : dict
-            Dictionary of fuctions to format the values. The keys should correspond
-            to either a column or index label in the table. If you want to format
-            along both axis, the key should be a tuple of the form: (index, column)
+            Dictionary of fuctions or format specs to format the values. The keys
+            should correspond to either a column or index label in the table. If
+            you want to format along both axis, the key should be a tuple of the
+            form: (index, column)
         axis : str, optional
             Which axis to format along, by default "columns"
 
@@ -293,9 +356,16 @@ class Table(ABC):
         ValueError
             Error is raised if the values in the formatters dict are not functions
         """
+        assert all(
+            _is_format_spec(f) for f in formatters.values() if isinstance(f, str)
+        ), "Format specs in the formatters dict must be valid, like ',.2f'"
+        formatters = {
+            key: _spec_formatter(f) if isinstance(f, str) else f
+            for key, f in formatters.items()
+        }
         assert all(
             callable(f) for f in formatters.values()
-        ), "Values in the formatters dict must be functions"
+        ), "Values in the formatters dict must be functions or format specs"
         self._formatters.update(formatters)
 
     def add_note(
@@ -321,7 +391,7 @@ class Table(ABC):
             end of the list by default.
         """
         assert isinstance(note, str), "Note must be a string"
-        assert alignment in ["l", "c", "r"], "alignment must be 'l', 'c', or 'r'"
+        assert alignment in NOTE_ALIGNMENTS, "alignment must be 'l', 'c', or 'r'"
         _position = len(self.notes) if position is None else position
         self.notes.insert(_position, (note, alignment, escape))
 
@@ -571,24 +641,74 @@ class Table(ABC):
     def _repr_html_(self):
         return self.render_html()
 
+    def _render_notes(self, renderer: str) -> list[tuple]:
+        """
+        Notes to include in the rendered table. Tables that add notes at render
+        time, like the significance levels, extend this instead of changing
+        self.notes, so a render never leaves the table modified.
+
+        Parameters
+        ----------
+        renderer : str
+            The renderer being used: 'latex', 'html', or 'ascii'
+        """
+        return self.notes
+
+    def _render_lines(self, renderer: str) -> dict[str, list]:
+        """
+        Custom lines to include in the rendered table. See _render_notes.
+        """
+        return self.custom_lines
+
     def _default_formatter(self, value: Union[int, float, str]) -> str:
-        if isinstance(value, (int, float)):
-            return f"{value:{self.thousands_sep}.{self.sig_digits}f}"
-        elif isinstance(value, str):
-            return value
+        is_number = _NUMBER_TYPES.get(type(value))
+        if is_number is None:
+            is_number = isinstance(value, (int, float))
+        if is_number:
+            spec = self._number_spec
+            if spec is None:
+                # only build the format spec again after sig_digits or
+                # thousands_sep change
+                spec = self._number_spec = f"{self.thousands_sep}.{self.sig_digits}f"
+            return _format_number(value, spec)
         return value
 
     def _format_value(self, _index: str, col: str, value: Union[int, float, str]):
-        if (_index, col) in self._formatters.keys():
+        if (_index, col) in self._formatters:
             formatter = self._formatters[(_index, col)]
-        elif _index in self._formatters.keys():
-            formatter = self._formatters.get(_index, self._default_formatter)
-        elif col in self._formatters.keys():
-            formatter = self._formatters.get(col, self._default_formatter)
+        elif _index in self._formatters:
+            formatter = self._formatters[_index]
+        elif col in self._formatters:
+            formatter = self._formatters[col]
         else:
             formatter = self._default_formatter
         return formatter(value)
 
+    def _resolve_formatters(self, index, columns) -> list[list[Callable]]:
+        """
+        Resolve the formatter for every cell up front, following the same
+        precedence as _format_value, so rows can be built without checking the
+        formatters dict for each cell.
+        """
+        formatters = self._formatters
+        col_formatters = [
+            formatters.get(col, self._default_formatter) for col in columns
+        ]
+        # (index, column) formatters are rare, so only check them when set
+        cell_formatters = any(isinstance(key, tuple) for key in formatters)
+        resolved = []
+        for _index in index:
+            row_formatters = col_formatters
+            if _index in formatters:
+                row_formatters = [formatters[_index]] * len(col_formatters)
+            if cell_formatters:
+                row_formatters = [
+                    formatters.get((_index, col), formatter)
+                    for col, formatter in zip(columns, row_formatters)
+                ]
+            resolved.append(row_formatters)
+        return resolved
+
     @abstractmethod
     def _create_rows(self) -> list[list[str]]:
         """
@@ -622,14 +742,16 @@ class GenericTable(Table):
         self.include_index = True
 
     def _create_rows(self):
+        formatters = self._resolve_formatters(self.df.index, self.columns)
         rows = []
-        for _index, row in self.df.iterrows():
-            _row = [self._index_labels.get(_index, _index)]
-            for col, value in zip(row.index, row.values):
-                formated_val = self._format_value(_index, col, value)
-                _row.append(formated_val)
-            if not self.include_index:
-                _row.pop(0)
+        for _index, values, row_formatters in zip(
+            self.df.index, self.df.to_numpy(), formatters
+        ):
+            _row = [
+                formatter(value) for formatter, value in zip(row_formatters, values)
+            ]
+            if self.include_index:
+                _row.insert(0, self._index_labels.get(_index, _index))
             # if _index in self._multiindex.keys():
             #     _row.insert(0, self._multiindex[_index]["index"])
             rows.append(_row)
@@ -679,27 +801,30 @@ class MeanDifferenceTable(Table):
         if self.ngroups < 2:
             raise ValueError("There must be at least two groups")
         self.alternative = alternative
-        self.type_gdf = df.groupby(group_var)
+        # observed=True so unused categories of a categorical group_var are skipped
+        self.type_gdf = df.groupby(group_var, observed=True)
         # adjust these to only count non-null values
-        self.grp_sizes = self.type_gdf.size()
+        self.grp_sizes = self.type_gdf.size().to_dict()
         self.grp_sizes["Overall Mean"] = df.shape[0]
-        self.means = self.type_gdf[var_list].mean().T
+        # get the means and standard errors in one pass over the groups
+        grp_stats = self.type_gdf[var_list].agg(["mean", "sem"])
+        total_stats = df[var_list].agg(["mean", "sem"])
+        self.means = grp_stats.xs("mean", axis=1, level=1).T
         # add toal means column to means
-        self.means["Overall Mean"] = df[var_list].mean()
-        total_sem = df[var_list].sem()
-        total_sem.name = "Overall Mean"
-        self.sem = pd.merge(
-            self.type_gdf[var_list].sem().T,
-            total_sem,
-            left_index=True,
-            right_index=True,
-        )
+        self.means["Overall Mean"] = total_stats.loc["mean"]
+        # both are indexed by var_list, so assign the column instead of merging
+        self.sem = grp_stats.xs("sem", axis=1, level=1).T
+        self.sem["Overall Mean"] = total_stats.loc["sem"]
         self.diff_pairs = diff_pairs
         self.ndiffs = len(self.diff_pairs) if self.diff_pairs else 1
         self.t_stats = {}
         self.pvalues = {}
         self.reset_params()
         self._get_diffs()
+        # positional lookups so rows don't go through .loc for every standard error
+        self._sem_array = self.sem.to_numpy()
+        self._sem_row_idx = {v: i for i, v in enumerate(self.sem.index)}
+        self._sem_col_idx = {c: i for i, c in enumerate(self.sem.columns)}
         self.ncolumns = self.means.shape[1]
         self.columns = self.means.columns
         diff_word = "Differences" if len(var_list) > 1 else "Difference"
@@ -753,113 +878,117 @@ class MeanDifferenceTable(Table):
         self._validate_input_type(value, bool)
         self._show_stars = value
 
-    @staticmethod
-    def _render(render_func):
-        def wrapper(self, **kwargs):
-            if self.show_n:
-                self.add_line(
-                    [
-                        f"N={self.grp_sizes[c]:,}" if c in self.grp_sizes.index else ""
+    def _render_lines(self, renderer: str) -> dict[str, list]:
+        lines = super()._render_lines(renderer)
+        if self.show_n and renderer != "ascii":
+            # copy the dict so the group sizes line is never added to the table
+            lines = defaultdict(list, lines)
+            lines["after-columns"] = lines["after-columns"] + [
+                {
+                    "line": [
+                        f"N={self.grp_sizes[c]:,}" if c in self.grp_sizes else ""
                         for c in self.means.columns
                     ],
-                    location="after-columns",
-                )
-            if self.show_stars:
-                _p = "p<"
-                if render_func.__name__ == "render_latex":
-                    _p = "p$<$"
-                stars = ", ".join(
-                    [
-                        f"{'*' * i} {_p} {p}"
-                        for i, p in enumerate(
-                            sorted(self.p_values, reverse=True), start=1
-                        )
-                    ]
-                )
-                note = f"Significance levels: {stars}"
-                self.add_note(note, alignment="r", escape=False)
-            output = render_func(self, **kwargs)
-            # remove all the supurflous lines that may not be needed in future renders
-            if self.show_n:
-                self.remove_line(location="after-columns", index=-1)
-            if self.show_stars:
-                self.remove_note(index=-1)
-                print("Note: Standard errors assume samples are drawn independently.")
-            return output
-
-        return wrapper
-
-    @_render
-    def render_latex(self, outfile=None, only_tabular=False) -> Union[str, None]:
-        return super().render_latex(outfile, only_tabular)
-
-    @_render
-    def render_html(self, outfile=None) -> Union[str, None]:
-        return super().render_html(outfile)
+                    "label": "",
+                }
+            ]
+        return lines
+
+    def _render_notes(self, renderer: str) -> list[tuple]:
+        notes = super()._render_notes(renderer)
+        if self.show_stars and renderer != "ascii":
+            _p = "p$<$" if renderer == "latex" else "p<"
+            stars = _stars_note(tuple(self.p_values), f" {_p} ")
+            notes = notes + [(f"Significance levels: {stars}", "r", False)]
+            print("Note: Standard errors assume samples are drawn independently.")
+        return notes
 
     def _get_diffs(self):
         # TODO: allow for standard errors caluclated under dependent samples
+        # groups can show up in several pairs, so only pull each one out once
+        group_frames = {}
+
+        def get_group(name):
+            if name not in group_frames:
+                group_frames[name] = self.type_gdf.get_group(name)[self.var_list]
+            return group_frames[name]
+
         def sig_test(grp0, grp1, col):
-            se_list = []
-            for var in self.var_list:
-                _stat, pval = stats.ttest_ind(
-                    grp0[var], grp1[var], equal_var=False, alternative=self.alternative
-                )
+            # test every variable at once rather than one ttest_ind call each
+            _stats, pvals = stats.ttest_ind(
+                grp0.to_numpy(dtype=float),
+                grp1.to_numpy(dtype=float),
+                axis=0,
+                equal_var=False,
+                alternative=self.alternative,
+            )
+            for var, _stat, pval in zip(self.var_list, _stats, pvals):
                 self.t_stats[f"{col}_{var}"] = _stat
                 self.pvalues[f"{col}_{var}"] = pval
-                s1 = grp0[var].std() ** 2
-                s2 = grp1[var].std() ** 2
-                n1 = grp0.shape[0]
-                n2 = grp1.shape[0]
-                se_list.append(np.sqrt(s1 / n1 + s2 / n2))
+            s1 = grp0.std() ** 2
+            s2 = grp1.std() ** 2
+            n1 = grp0.shape[0]
+            n2 = grp1.shape[0]
+
+            return np.sqrt(s1 / n1 + s2 / n2)
 
-            return pd.Series(se_list, index=self.var_list)
+        # subtract the group means as plain arrays rather than aligned Series
+        means_arr = self.means.to_numpy()
+        means_idx = {c: i for i, c in enumerate(self.means.columns)}
+
+        def mean_diff(grp0, grp1):
+            return means_arr[:, means_idx[grp0]] - means_arr[:, means_idx[grp1]]
 
         if self.diff_pairs is None:
-            self.means["Difference"] = (
-                self.means[self.groups[0]] - self.means[self.groups[1]]
+            self.means["Difference"] = mean_diff(self.groups[0], self.groups[1])
+            ses = sig_test(
+                get_group(self.groups[0]), get_group(self.groups[1]), "Difference"
             )
-            grp0 = self.type_gdf.get_group(self.groups[0])
-            grp1 = self.type_gdf.get_group(self.groups[1])
-            ses = sig_test(grp0, grp1, "Difference")
-            ses.name = "Difference"
-            self.sem = self.sem.merge(ses, left_index=True, right_index=True)
+            self.sem["Difference"] = ses
         else:
             for pair in self.diff_pairs:
                 _col = f"{pair[0]} - {pair[1]}"
-                self.means[_col] = self.means[pair[0]] - self.means[pair[1]]
-                ses = sig_test(
-                    self.type_gdf.get_group(pair[0]),
-                    self.type_gdf.get_group(pair[1]),
-                    _col,
-                )
-                ses.name = _col
-                self.sem = self.sem.merge(ses, left_index=True, right_index=True)
+                self.means[_col] = mean_diff(pair[0], pair[1])
+                ses = sig_test(get_group(pair[0]), get_group(pair[1]), _col)
+                self.sem[_col] = ses
 
     def _create_rows(self):
         rows = []
-        for _index, row in self.means.iterrows():
-            sem_row = [""]
-            _row = [self._index_labels.get(_index, _index)]
-            for col, value in zip(row.index, row.values):
-                formatted_val = self._format_value(_index, col, value)
-                if self.show_standard_errors:
-                    try:
-                        se = self.sem.loc[_index, col]
-                        formatted_se = self._format_value(_index, col, se)
-                        sem_row.append(f"({formatted_se})")
-                    except KeyError:
+        pval_stars = {}
+        if self.show_stars:
+            # get the stars for every p-value at once instead of once per cell
+            pval_stars = dict(
+                zip(
+                    self.pvalues,
+                    pstars_array(list(self.pvalues.values()), self.p_values),
+                )
+            )
+        show_ses = self.show_standard_errors
+        show_stars = self.show_stars
+        columns = self.means.columns
+        sem_cols = [self._sem_col_idx.get(col) for col in columns]
+        # rows are read one at a time, so lay the means out row-major first
+        means = np.ascontiguousarray(self.means.to_numpy())
+        formatters = self._resolve_formatters(self.means.index, columns)
+        for _index, values, row_formatters in zip(self.means.index, means, formatters):
+            _row = [
+                formatter(value) for formatter, value in zip(row_formatters, values)
+            ]
+            if show_stars:
+                _row = [
+                    f"{formatted_val}{pval_stars.get(f'{col}_{_index}', '')}"
+                    for formatted_val, col in zip(_row, columns)
+                ]
+            rows.append([self._index_labels.get(_index, _index)] + _row)
+            if show_ses:
+                sem_row = [""]
+                sem_i = self._sem_row_idx.get(_index)
+                for sem_j, formatter in zip(sem_cols, row_formatters):
+                    if sem_i is None or sem_j is None:
                         sem_row.append("")
-                if self.show_stars:
-                    try:
-                        pval = self.pvalues[f"{col}_{_index}"]
-                        stars = pstars(pval, self.p_values)
-                    except KeyError:
-                        stars = ""
-                    formatted_val = f"{formatted_val}{stars}"
-                _row.append(formatted_val)
-            rows.append(_row)
-            if self.show_standard_errors:
+                    else:
+                        se = self._sem_array[sem_i, sem_j]
+                        sem_row.append(f"({formatter(se)})")
                 rows.append(sem_row)
         return rows
 
@@ -935,15 +1064,20 @@ class ModelTable(Table):
         self.ncolumns = len(models)
         dep_vars = []
         for mod in models:
-            try:
-                mod_obj = st.SupportedModels[type(mod)](mod)
-                self.models.append(mod_obj)
-            except KeyError as e:
+            mod_type = type(mod)
+            model_data = st.SupportedModels.get(mod_type)
+            if model_data is None:
+                model_data = st.SupportedModels.get(
+                    f"{mod_type.__module__}.{mod_type.__qualname__}"
+                )
+            if model_data is None:
                 msg = (
                     f"{type(mod)} is unsupported. To use custom models, "
                     "add them to the `st.SupportedModels` dictionary."
                 )
-                raise KeyError(msg) from e
+                raise KeyError(msg)
+            mod_obj = model_data(mod)
+            self.models.append(mod_obj)
             self.params.update(mod_obj.param_labels)
             dep_vars.append(mod_obj.dependent_variable)
 
@@ -1004,39 +1138,58 @@ class ModelTable(Table):
             assert p in self.all_param_labels
         self.param_labels = order
 
+    def _model_estimates(self, mod) -> dict:
+        """
+        Map each parameter label in a model to an array holding its estimate,
+        standard error, and confidence interval bounds along with its stars,
+        so building a cell needs one dictionary lookup rather than five pandas
+        lookups.
+        """
+        estimates = pd.concat(
+            [mod.params, mod.sterrs, mod.cis_low, mod.cis_high, mod.pvalues], axis=1
+        )
+        values = estimates.to_numpy()
+        stars = pstars_array(values[:, 4], self.p_values)
+        return dict(zip(estimates.index, zip(values, stars)))
+
     def _create_rows(self):
+        # these are checked for every cell, so only go through the properties once
+        spec = f".{self.sig_digits}f"
+        show_stars = self.show_stars
+        show_ses = self.show_ses
+        show_cis = self.show_cis
+        single_row = self.single_row
+        model_estimates = [self._model_estimates(mod) for mod in self.models]
         rows = []
         for param in self.param_labels:
             row = [self._index_labels.get(param, param)]
             se_row = [""]
             ci_row = [""]
-            for i, mod in enumerate(self.models):
-                if param not in mod.param_labels:
+            for i, estimates in enumerate(model_estimates):
+                if param not in estimates:
                     row.append("")
                     se_row.append("")
                     ci_row.append("")
                     continue
-                param_val = mod.params[param]
-                pvalue = mod.pvalues[param]
-                se = f"({mod.sterrs[param]:.{self.sig_digits}f})"
+                values, stars = estimates[param]
+                param_val, sterr, ci_low, ci_high = values[:4]
+                se = f"({format(sterr, spec)})"
                 se_row.append(se)
-                ci_low = f"{mod.cis_low[param]:.{self.sig_digits}f}"
-                ci_high = f"{mod.cis_high[param]:.{self.sig_digits}f}"
-                ci = f"({ci_low}, {ci_high})"
+                ci = f"({format(ci_low, spec)}, {format(ci_high, spec)})"
                 ci_row.append(ci)
-                stars = pstars(pvalue, self.p_values)
-                row_val = (
-                    f"{self._format_value(param, i, param_val)}"
-                    + stars * self.show_stars
-                    + f" {se}" * self.single_row * self.show_ses
-                    + f" {ci}" * self.single_row * self.show_cis
-                )
+                row_val = f"{self._format_value(param, i, param_val)}"
+                if show_stars:
+                    row_val += stars
+                if single_row and show_ses:
+                    row_val += f" {se}"
+                if single_row and show_cis:
+                    row_val += f" {ci}"
 
                 row.append(row_val)
             rows.append(row)
-            if self.show_ses and not self.single_row:
+            if show_ses and not single_row:
                 rows.append(se_row)
-            if self.show_cis and not self.single_row:
+            if show_cis and not single_row:
                 rows.append(ci_row)
         return rows
 
@@ -1076,53 +1229,13 @@ class ModelTable(Table):
                 rows.append(row)
         return rows
 
-    @staticmethod
-    def _render(render_func: Callable):
-        """
-        Wrapper for the render function to add a p-value note formatted to fit
-        the type of renderer being used.
-
-        Parameters
-        ----------
-        render_func : Callable
-            The rendering function being wrapped
-        """
-
-        def wrapper(self, **kwargs):
-            if self.show_stars:
-                _p = "p<"
-                if render_func.__name__ == "render_latex":
-                    _p = "p$<$"
-                stars = ", ".join(
-                    [
-                        f"{'*' * i}{_p}{p}"
-                        for i, p in enumerate(
-                            sorted(self.p_values, reverse=True), start=1
-                        )
-                    ]
-                )
-                stars_note = f"{stars}"
-                self.add_note(stars_note, alignment="r", escape=False, position=0)
-                _stars_note = (stars_note, "r", False)
-            output = render_func(self, **kwargs)
-            if self.show_stars:
-                self.remove_note(note=_stars_note)
-
-            return output
-
-        return wrapper
-
-    @_render
-    def render_latex(self, outfile=None, only_tabular=False) -> Union[str, None]:
-        return super().render_latex(outfile, only_tabular)
-
-    @_render
-    def render_html(self, outfile=None) -> Union[str, None]:
-        return super().render_html(outfile)
-
-    @_render
-    def render_ascii(self) -> Union[str, None]:
-        return super().render_ascii()
+    def _render_notes(self, renderer: str) -> list[tuple]:
+        notes = super()._render_notes(renderer)
+        if self.show_stars:
+            _p = "p$<$" if renderer == "latex" else "p<"
+            stars = _stars_note(tuple(self.p_values), _p)
+            notes = [(stars, "r", False)] + notes
+        return notes
 
     ##### Properties #####
     @property
@@ -37,3 +37,18 @@ def data():
             ),
         ]
     )
+
+
+@pytest.fixture(scope="session")
+def ols_models(data):
+    smf = pytest.importorskip("statsmodels.formula.api")
+    return (
+        smf.ols("A ~ B + C -1", data=data).fit(),
+        smf.ols("A ~ B + C", data=data).fit(),
+    )
+
+
+@pytest.fixture(scope="session")
+def probit_model(data):
+    smf = pytest.importorskip("statsmodels.formula.api")
+    return smf.probit("binary ~ A + B", data=data).fit()
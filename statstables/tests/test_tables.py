@@ -1,14 +1,14 @@
 import pytest
-import statsmodels.formula.api as smf
+import pandas as pd
 from statstables import tables
 
 
-def test_summary_table(data):
+def test_summary_table(data, tmp_path):
     table = tables.SummaryTable(df=data, var_list=["A", "B", "C"])
     table.custom_formatters(
         {
-            "count": lambda x: f"{x:,.0f}",
-            "max": lambda x: f"{x:,.2f}",
+            "count": ",.0f",
+            "max": ",.2f",
             ("mean", "A"): lambda x: f"{x:,.2f}",
             ("std", "C"): lambda x: f"{x:,.4f}",
         }
@@ -25,8 +25,17 @@ def test_summary_table(data):
     table.caption = "Summary Table"
     table.label = "table:summarytable"
     table.render_html()
+    assert " 300 " in table.render_ascii()
     table.render_latex()
     table.render_latex(only_tabular=True)
+    # write output under tmp_path so tests never share files in the working dir
+    outfile = tmp_path / "summary_table.tex"
+    table.render_latex(outfile=outfile)
+    assert outfile.read_text() == table.render_latex()
+    table.rename_columns({"C": "c_%"})
+    assert "c\\_\\%" in table.render_latex()
+    with pytest.raises(AssertionError):
+        table.custom_formatters({"min": "not a spec"})
 
     with pytest.raises(AssertionError):
         table.caption_location = "middle"
@@ -39,7 +48,18 @@ def test_summary_table(data):
             setattr(table, prop, "True")
 
 
-def test_mean_differences_table(data):
+def test_summary_table_formatting():
+    df = pd.DataFrame({"A": [-0.0, -0.0], "B": [1234.56, 2000.0]})
+    table = tables.SummaryTable(df=df, var_list=["A", "B"])
+    table.custom_formatters({"min": ",.1f"})
+    text = table.render_ascii()
+    assert " 1,234.6 " in text
+    # 0.0 and -0.0 compare equal but must not share a formatted value
+    assert " 0.000 " in text
+    assert " -0.000 " in text
+
+
+def test_mean_differences_table(data, capsys):
     table = tables.MeanDifferenceTable(
         df=data,
         var_list=["A", "B", "C"],
@@ -50,6 +70,33 @@ def test_mean_differences_table(data):
     table.label = "table:differencesinmeans"
     table.caption_location = "top"
     table.custom_formatters({("A", "X"): lambda x: f"{x:.2f}"})
+    assert "Significance levels" in table.render_html()
+    assert capsys.readouterr().out.count("drawn independently") == 1
+    # notes and lines added while rendering shouldn't stay on the table
+    assert table.notes == []
+    assert table.custom_lines["after-columns"] == []
+
+    # a categorical group variable should give the same table
+    cat_table = tables.MeanDifferenceTable(
+        df=data.assign(group=data["group"].astype("category")),
+        var_list=["A", "B", "C"],
+        group_var="group",
+        diff_pairs=[("X", "Y"), ("X", "Z"), ("Y", "Z")],
+    )
+    assert cat_table.means.equals(table.means)
+
+    # a bool dummy mixed in with float variables should still be tested
+    bool_table = tables.MeanDifferenceTable(
+        df=data.assign(dummy=data["binary"].astype(bool)),
+        var_list=["A", "dummy"],
+        group_var="group",
+        diff_pairs=[("X", "Y")],
+    )
+    assert "X - Y_dummy" in bool_table.pvalues
+    # rows keep their label without the index, so no value may be dropped
+    bool_table.include_index = False
+    diff = f"{bool_table.means.loc['A', 'X - Y']:.3f}"
+    assert diff in bool_table.render_ascii()
 
     bool_properties = ["show_n", "show_standard_errors", "show_stars"]
     for prop in bool_properties:
@@ -59,9 +106,8 @@ def test_mean_differences_table(data):
             setattr(table, prop, "True")
 
 
-def test_model_table(data):
-    mod1 = smf.ols("A ~ B + C -1", data=data).fit()
-    mod2 = smf.ols("A ~ B + C", data=data).fit()
+def test_model_table(ols_models, probit_model):
+    mod1, mod2 = ols_models
     mod_table = tables.ModelTable(models=[mod1, mod2])
     mod_table.show_model_nums = True
     mod_table.parameter_order(["Intercept", "B", "C"])
@@ -70,8 +116,10 @@ def test_model_table(data):
     assert "N. Groups" not in mod_text
     assert "Pseudo R2" not in mod_text
 
-    binary_mod = smf.probit("binary ~ A + B", data=data).fit()
-    binary_table = tables.ModelTable(models=[binary_mod])
+    with pytest.raises(KeyError):
+        tables.ModelTable(models=["not a model"])
+
+    binary_table = tables.ModelTable(models=[probit_model])
     binary_text = binary_table.render_latex()
     assert "Pseudo $R^2$" in binary_text
     binary_table.show_pseudo_r2 = False
@@ -1,3 +1,6 @@
+import numpy as np
+
+
 def format_values(vals, pvals, plevels, sigdigits):
     formatted_vals = []
     for val, pval in zip(vals, pvals):
@@ -22,16 +25,25 @@ def pstars(value, plevels):
     return stars
 
 
+def pstars_array(values, plevels) -> list[str]:
+    """
+    Same as pstars, but gets the stars for an entire array of p-values at once
+    """
+    nstars = (~(np.asarray(values)[:, None] > np.asarray(plevels))).sum(axis=1)
+    return ["*" * n for n in nstars]
+
+
 VALID_LINE_LOCATIONS = [
     "after-multicolumns",
     "after-columns",
     "after-body",
     "after-footer",
 ]
+_LINE_LOCATIONS = frozenset(VALID_LINE_LOCATIONS)
 
 
 def validate_line_location(line_location: str) -> None:
-    if line_location not in VALID_LINE_LOCATIONS:
+    if line_location not in _LINE_LOCATIONS:
         raise ValueError(
             f"Invalid line location: {line_location}. "
             f"Valid line locations are: {VALID_LINE_LOCATIONS}"